@@ -27,11 +27,14 @@ import json
 import math
 import statistics
 import warnings
-from collections import defaultdict
 from datetime import timedelta
+from itertools import islice, zip_longest
 from pathlib import Path
 
+import numpy as np
+
 from interlog import __version__
+from interlog.recorder import EVENT_FIELDS
 from interlog.security import lock_down
 
 # Version of the summary.json structure (not the tool version). Bump on any
@@ -51,6 +54,18 @@ EFFICIENCY_RESAMPLE_HZ = 30.0
 PRE_CLICK_RADIUS_PX = 8         # "near the target": dwell is measured within this radius of a click
 PRE_CLICK_MAX_S = 2.0           # cap pre-click dwell so a long idle isn't counted as hesitation
 
+# Numeric columns of the events CSV (coordinates are whole pixels, truncated the
+# way load_event_rows does). Every other column is text.
+FLOAT_FIELDS = ("timestamp",)
+INT_FIELDS = ("x", "y", "dx", "dy")
+# The event fields the statistics, intensity, and text reconstruction read.
+# Loading only these (see InteractionAnalyzer.load_events) skips parsing the
+# button, dx, and drag-coordinate columns.
+ANALYSIS_FIELDS = ("timestamp", "event_type", "x", "y", "dy", "key")
+
+# Rows parsed per chunk when reading the events CSV without pyarrow.
+CSV_CHUNK_ROWS = 65_536
+
 
 def _resample_points(points, dt):
     """Resample a time-stamped polyline onto a fixed time step ``dt``.
@@ -165,12 +180,32 @@ def read_session_metadata(events_file):
     return {}
 
 
+def session_events_file(session_dir):
+    """The events file inside a session folder.
+
+    ``events.csv`` unless the session was recorded with ``--format parquet``, in
+    which case only ``events.parquet`` exists. Falls back to ``events.csv`` when
+    neither is present, so callers report the conventional name as missing.
+    """
+    session_dir = Path(session_dir)
+    csv_file = session_dir / "events.csv"
+    parquet_file = session_dir / "events.parquet"
+    if not csv_file.exists() and parquet_file.exists():
+        return parquet_file
+    return csv_file
+
+
 def load_event_rows(events_file):
     """Read a session's events CSV, coercing numeric fields in place.
 
     A non-numeric cell is left as its original string rather than aborting the
-    whole load. Shared by the analyzer and the heatmap so both read the same way.
+    whole load. For scripts that want plain rows (``tools/capture_viewer_gif.py``);
+    the analyzer, viewer and heatmap read :func:`load_event_columns` instead.
+    A Parquet events file is read through :func:`load_event_columns`, so its
+    missing numbers come back as None rather than "".
     """
+    if Path(events_file).suffix == ".parquet":
+        return event_rows_from_columns(load_event_columns(events_file))
     events = []
     with open(events_file, newline="") as f:
         reader = csv.DictReader(f)
@@ -185,13 +220,264 @@ def load_event_rows(events_file):
     return events
 
 
-def mouse_down_clicks(events):
-    """Time-ordered mouse-down clicks as ``{timestamp, x, y}`` dicts."""
-    return [
-        {"timestamp": e["timestamp"], "x": e.get("x"), "y": e.get("y")}
-        for e in events
-        if e["event_type"] == "mouse_down"
-    ]
+def _parse_numeric(cells, integer=False):
+    """Parse one column of CSV cells to a float64 array.
+
+    Blank cells become NaN. The cells are fed straight into ``np.fromiter``,
+    which beats a numpy string-to-float cast by about 4x. A stray non-numeric
+    cell aborts that pass, so only then fall back to a cell-by-cell parse that
+    maps bad cells to NaN as well.
+    """
+    try:
+        out = np.fromiter(
+            (float(c) if c else math.nan for c in cells), np.float64, len(cells)
+        )
+    except ValueError:
+        out = np.array([_to_float(c) for c in cells], dtype=np.float64)
+    return np.trunc(out) if integer else out
+
+
+def _to_float(cell):
+    try:
+        return float(cell)
+    except ValueError:
+        return math.nan
+
+
+def load_event_columns(events_file, fields=None):
+    """Read a session's events CSV into one numpy array per column.
+
+    The columnar counterpart of :func:`load_event_rows`: each numeric column is
+    parsed straight into a float64 array with ``np.fromiter`` instead of into a
+    list of Python values, and text columns become string arrays. Missing numbers (a key press has no ``x``) are
+    NaN. Every ``EVENT_FIELDS`` column is present even if the file lacks it, so
+    callers can index columns unconditionally.
+
+    ``fields`` restricts the result to those columns (each still guaranteed
+    present). The others are never converted, which is most of the load cost:
+    text columns such as ``button`` or the drag coordinates are as expensive to
+    build as the numbers the statistics actually use.
+
+    When the optional ``pyarrow`` package is installed its multithreaded CSV
+    reader does the parsing; otherwise (or if Arrow rejects the file, e.g. a
+    stray non-numeric cell) the stdlib ``csv`` path is used. Both give the same
+    columns. A ``.parquet`` file (``record --format parquet``) is read with
+    ``pyarrow.parquet``, which is then required.
+    """
+    wanted = EVENT_FIELDS if fields is None else list(fields)
+    if Path(events_file).suffix == ".parquet":
+        columns, n = _read_columns_parquet(events_file, fields)
+    else:
+        parsed = _read_columns_arrow(events_file, fields)
+        columns, n = parsed if parsed is not None else _read_columns_csv(events_file, fields)
+    for name in wanted:
+        if name not in columns:
+            numeric = name in FLOAT_FIELDS or name in INT_FIELDS
+            columns[name] = np.full(n, np.nan) if numeric else np.full(n, "")
+    return columns
+
+
+def _read_columns_csv(events_file, fields=None):
+    """Parse the events CSV with the stdlib reader (the dependency-free path).
+
+    Rows are parsed ``CSV_CHUNK_ROWS`` at a time into per-column arrays that
+    are joined at the end, so only one chunk of Python cell strings is alive at
+    once rather than the whole file's. Returns ``(columns, row_count)``.
+    """
+    with open(events_file, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Position of each column; a repeated name takes its last position, as
+        # with DictReader.
+        index = {name: i for i, name in enumerate(header)}
+        picked = [(i, name) for name, i in index.items() if fields is None or name in fields]
+        chunks = {name: [] for _, name in picked}
+        total = 0
+        while True:
+            block = list(islice(reader, CSV_CHUNK_ROWS))
+            if not block:
+                break
+            rows = [row for row in block if row]  # DictReader skips blank lines too
+            cells = list(zip_longest(*rows, fillvalue=""))
+            n = len(rows)
+            total += n
+            for i, name in picked:
+                col = cells[i] if i < len(cells) else ("",) * n
+                if name in FLOAT_FIELDS or name in INT_FIELDS:
+                    chunks[name].append(_parse_numeric(col, integer=name in INT_FIELDS))
+                else:
+                    chunks[name].append(np.asarray(col, dtype=str))
+
+    columns = {}
+    for name, parts in chunks.items():
+        if parts:
+            columns[name] = np.concatenate(parts)
+        elif name in FLOAT_FIELDS or name in INT_FIELDS:
+            columns[name] = np.empty(0)
+        else:
+            columns[name] = np.asarray((), dtype=str)
+    return columns, total
+
+
+def _read_columns_arrow(events_file, fields=None):
+    """Parse the events CSV with ``pyarrow.csv``, or None to use the csv path.
+
+    Numeric columns are typed up front so Arrow never has to infer them; every
+    other column is read as text (an empty cell stays ""), and columns outside
+    ``fields`` are skipped by Arrow itself. Returns ``(columns, row_count)``, or
+    None when pyarrow is not installed or the file is something Arrow is strict
+    about and the stdlib reader tolerates (a non-numeric cell, a short row, no
+    header).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    numeric = FLOAT_FIELDS + INT_FIELDS
+    try:
+        with open(events_file, newline="") as f:
+            header = next(csv.reader(f), [])
+        if not header or len(set(header)) != len(header):
+            return None
+        picked = [name for name in header if fields is None or name in fields]
+        table = pacsv.read_csv(
+            events_file,
+            convert_options=pacsv.ConvertOptions(
+                column_types={
+                    name: pa.float64() if name in numeric else pa.string()
+                    for name in header
+                },
+                include_columns=picked,
+                strings_can_be_null=False,
+            ),
+        )
+    except (pa.ArrowInvalid, OSError):
+        return None
+
+    columns = {}
+    for name in picked:
+        col = table.column(name)
+        if name in numeric:
+            values = np.asarray(col, dtype=np.float64)
+            columns[name] = np.trunc(values) if name in INT_FIELDS else values
+        else:
+            columns[name] = np.asarray(col.to_pylist(), dtype=str)
+    return columns, table.num_rows
+
+
+def _read_columns_parquet(events_file, fields=None):
+    """Read a Parquet events file written by the recorder into numpy columns.
+
+    Only the ``fields`` columns are read from disk. Returns ``(columns, row_count)``.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            f"Reading {Path(events_file).name} requires pyarrow. "
+            'Install it with: pip install "interlog[arrow]"'
+        ) from None
+
+    parquet = pq.ParquetFile(events_file)
+    picked = [name for name in parquet.schema_arrow.names if fields is None or name in fields]
+    table = parquet.read(columns=picked)
+    columns = {}
+    for name in picked:
+        col = table.column(name)
+        if name in FLOAT_FIELDS or name in INT_FIELDS:
+            values = np.asarray(col, dtype=np.float64)
+            columns[name] = np.trunc(values) if name in INT_FIELDS else values
+        else:
+            columns[name] = np.asarray(col.fill_null("").to_pylist(), dtype=str)
+    return columns, parquet.metadata.num_rows
+
+
+def _sorted_by_time(columns):
+    """``columns`` reordered into non-decreasing timestamp order (stable).
+
+    Returned as-is, with no copy, when already sorted, which is the usual case.
+    """
+    ts = columns.get("timestamp")
+    if ts is None or not (np.diff(ts) < 0).any():
+        return columns
+    order = np.argsort(ts, kind="stable")
+    return {name: col[order] for name, col in columns.items()}
+
+
+def event_rows_from_columns(columns):
+    """Row view of :func:`load_event_columns` output: one dict per event.
+
+    For code that walks events one at a time. Integer fields come back as
+    ``int``, and a missing number as None.
+    """
+    fields, values = [], []
+    for name, col in columns.items():
+        fields.append(name)
+        if name in INT_FIELDS:
+            values.append([None if math.isnan(v) else int(v) for v in col.tolist()])
+        elif name in FLOAT_FIELDS:
+            values.append([None if math.isnan(v) else v for v in col.tolist()])
+        else:
+            values.append(col.tolist())
+    return [dict(zip(fields, row)) for row in zip(*values)]
+
+
+def _rage_click_spans(ts, xs, ys, time_window=1.0, distance_threshold=50):
+    """Index spans ``(start, end)`` of rage-click bursts in click arrays.
+
+    The array form of :func:`detect_rage_clicks` (same rules, same greedy
+    consumption). ``ts``/``xs``/``ys`` are time-ordered float arrays with NaN for
+    a missing coordinate; a click at ``end`` is the first one outside the burst.
+    Window ends come from one ``searchsorted`` and the chained distance check from
+    a prefix count of "too far" steps; the greedy walk then visits only the
+    bursts themselves in Python.
+    """
+    n = len(ts)
+    if n < 3:
+        return []
+    starts = np.arange(n)
+    # ends[i]: one past the last click within time_window of click i. The sum
+    # ts + time_window can round either way relative to the subtraction test
+    # (3.9 + 1.0 == 4.9 although 4.9 - 3.9 > 1.0; 0.594 + 1.0 < 1.594 although
+    # 1.594 - 0.594 == 1.0), so nudge each end until the subtraction agrees.
+    ends = np.searchsorted(ts, ts + time_window, side="right")
+    while True:
+        over = ts[ends - 1] - ts > time_window
+        if not over.any():
+            break
+        ends[over] -= 1
+    while True:
+        nxt = np.minimum(ends, n - 1)
+        under = (ends < n) & (ts[nxt] - ts <= time_window)
+        if not under.any():
+            break
+        ends[under] += 1
+    # near[k]: click k+1 is within the threshold of click k (squared, so no
+    # sqrt; a NaN coordinate compares as not near). far[k] counts the steps
+    # before click k that are not near, so window [i, j) chains iff
+    # far[j - 1] == far[i].
+    with np.errstate(invalid="ignore"):
+        near = np.diff(xs) ** 2 + np.diff(ys) ** 2 <= distance_threshold ** 2
+    far = np.concatenate(([0], np.cumsum(~near)))
+    qualifies = (ends - starts >= 3) & (far[ends - 1] == far[starts])
+
+    # Greedy consumption: after a burst [i, ends[i]) the next burst is the first
+    # qualifying start at or past ends[i]. Precompute that successor for every
+    # qualifying start, so the walk below takes one step per burst rather than
+    # one per qualifying click.
+    cand = np.flatnonzero(qualifies)
+    if not len(cand):
+        return []
+    succ = np.searchsorted(cand, ends[cand]).tolist()
+    cand_list, ends_list = cand.tolist(), ends[cand].tolist()
+    spans = []
+    k = 0
+    while k < len(cand_list):
+        spans.append((cand_list[k], ends_list[k]))
+        k = succ[k]
+    return spans
 
 
 def detect_rage_clicks(clicks, time_window=1.0, distance_threshold=50):
@@ -211,41 +497,23 @@ def detect_rage_clicks(clicks, time_window=1.0, distance_threshold=50):
         One dict per burst with the seed click plus ``click_count`` and
         ``timestamps`` (every click in the burst).
     """
-    bursts = []
-    i = 0
-    n = len(clicks)
-    while i < n - 1:
-        window = [clicks[i]]
-        j = i + 1
-        while j < n and clicks[j]["timestamp"] - clicks[i]["timestamp"] <= time_window:
-            window.append(clicks[j])
-            j += 1
+    def _coord(v):
+        return float(v) if isinstance(v, (int, float)) else math.nan
 
-        if len(window) < 3:
-            i += 1
-            continue
-
-        first = window[0]
-        # Chain the distance check click-to-click rather than anchoring every
-        # click to the seed: a burst that drifts across the screen (each click
-        # near the last, but the last far from the first) is still one burst.
-        same_area = all(
-            prev["x"] is not None and cur["x"] is not None
-            and math.hypot(cur["x"] - prev["x"], cur["y"] - prev["y"]) <= distance_threshold
-            for prev, cur in zip(window, window[1:])
-        )
-        if same_area:
-            bursts.append({
-                "timestamp": first["timestamp"],
-                "x": first["x"],
-                "y": first["y"],
-                "click_count": len(window),
-                "timestamps": [c["timestamp"] for c in window],
-            })
-            i = j  # consume the whole burst so it is not recounted
-        else:
-            i += 1
+    ts = np.array([c["timestamp"] for c in clicks], dtype=np.float64)
+    xs = np.array([_coord(c["x"]) for c in clicks], dtype=np.float64)
+    ys = np.array([_coord(c["y"]) for c in clicks], dtype=np.float64)
 
+    bursts = []
+    for i, j in _rage_click_spans(ts, xs, ys, time_window, distance_threshold):
+        first = clicks[i]
+        bursts.append({
+            "timestamp": first["timestamp"],
+            "x": first["x"],
+            "y": first["y"],
+            "click_count": j - i,
+            "timestamps": [c["timestamp"] for c in clicks[i:j]],
+        })
     return bursts
 
 
@@ -260,44 +528,120 @@ class InteractionAnalyzer:
             events_file: Path to the events CSV file.
         """
         self.events_file = Path(events_file)
-        self.events = []
+        self.columns = {}
         self.stats = {}
+        self._events = None
+        self._masks = {}
+
+    def load_events(self, fields=None):
+        """Load events from CSV file into ``self.columns`` (one array per field).
+
+        ``fields`` limits which columns are loaded (see
+        :func:`load_event_columns`); pass ``ANALYSIS_FIELDS`` when only the
+        statistics are needed. By default every column is loaded.
+
+        The columns are the analyzer's only copy of the events; every statistic
+        is computed from them. They are guaranteed to be in non-decreasing
+        timestamp order, so the first and last timestamps bound the session and
+        time windows can be found with ``searchsorted``. Recorded sessions are
+        almost sorted already (the mouse and keyboard listeners can interleave
+        by a few microseconds); any out-of-order rows are stably re-sorted here.
+        """
+        self.columns = _sorted_by_time(load_event_columns(self.events_file, fields))
+        self._events = None
+        self._masks = {}
+
+    @property
+    def event_count(self):
+        """Number of loaded events."""
+        return len(self.columns["timestamp"]) if self.columns else 0
 
-    def load_events(self):
-        """Load events from CSV file."""
-        self.events = load_event_rows(self.events_file)
+    @property
+    def events(self):
+        """Loaded events as a list of dicts, for row-at-a-time consumers.
+
+        Derived from the columns on first use (and cached); the analyzer itself
+        does not use it.
+        """
+        if self._events is None:
+            self._events = event_rows_from_columns(self.columns) if self.columns else []
+        return self._events
+
+    def _is(self, event_type):
+        """Boolean mask of the ``event_type`` events, cached per loaded session.
+
+        Comparing the whole text column is a full scan; the statistics ask for
+        the same few types many times over, so each one is scanned only once.
+        """
+        mask = self._masks.get(event_type)
+        if mask is None:
+            mask = self._masks[event_type] = self.columns["event_type"] == event_type
+        return mask
+
+    def _positioned(self, event_type):
+        """``(t, x, y)`` arrays of the ``event_type`` events that carry a position."""
+        c = self.columns
+        keep = self._is(event_type) & ~np.isnan(c["x"]) & ~np.isnan(c["y"])
+        return c["timestamp"][keep], c["x"][keep], c["y"][keep]
+
+    def _positioned_points(self, event_type):
+        """:meth:`_positioned` as a list of ``(t, x, y)`` with integer pixels."""
+        t, x, y = self._positioned(event_type)
+        return list(zip(t.tolist(), x.astype(int).tolist(), y.astype(int).tolist()))
+
+    def rage_clicks(self, time_window=1.0, distance_threshold=50):
+        """Rage-click bursts in the loaded session (see :func:`detect_rage_clicks`)."""
+        c = self.columns
+        if not self.event_count:
+            return []
+        is_click = self._is("mouse_down")
+        ts, xs, ys = c["timestamp"][is_click], c["x"][is_click], c["y"][is_click]
+
+        def _px(v):
+            return None if math.isnan(v) else int(v)
+
+        return [
+            {
+                "timestamp": float(ts[i]),
+                "x": _px(xs[i]),
+                "y": _px(ys[i]),
+                "click_count": j - i,
+                "timestamps": ts[i:j].tolist(),
+            }
+            for i, j in _rage_click_spans(ts, xs, ys, time_window, distance_threshold)
+        ]
 
     def calculate_statistics(self):
         """Calculate summary statistics from events."""
-        if not self.events:
+        etype = self.columns.get("event_type")
+        if etype is None or not len(etype):
             return self.stats
 
-        # Basic counts
-        event_counts = defaultdict(int)
-        for event in self.events:
-            event_counts[event["event_type"]] += 1
+        # Everything below derives from a handful of arrays computed once here:
+        # per-type counts, the timestamp column and its gaps, and the cached
+        # per-type masks (see _is), which the helper methods share. The counts
+        # come from those masks too: factorizing the whole text column first
+        # (np.unique) costs several times more than these few equality scans.
+        event_counts = {
+            name: int(np.count_nonzero(self._is(name)))
+            for name in ("mouse_move", "mouse_down", "scroll", "key_press", "drag")
+        }
+        ts = self.columns["timestamp"]
+        gaps = np.diff(ts)
+        is_move = self._is("mouse_move")
 
-        # Session duration
-        timestamps = [e["timestamp"] for e in self.events]
-        min_time = min(timestamps)
-        duration = max(timestamps) - min_time
+        # Session duration (columns are time-ordered; see load_events)
+        min_time = float(ts[0])
+        duration = float(ts[-1]) - min_time
 
-        # Click locations for rage click detection
-        clicks = mouse_down_clicks(self.events)
-        rage_clicks = detect_rage_clicks(clicks)
+        rage_clicks = self.rage_clicks()
 
         # Pauses (gaps between consecutive events)
-        pauses = [
-            self.events[i]["timestamp"] - self.events[i - 1]["timestamp"]
-            for i in range(1, len(self.events))
-        ]
-        longest_pause = max(pauses) if pauses else 0
-        avg_pause = sum(pauses) / len(pauses) if pauses else 0
+        longest_pause = float(gaps.max()) if gaps.size else 0
+        avg_pause = float(gaps.mean()) if gaps.size else 0
 
         # Total interactions (excluding mouse moves)
-        total_interactions = sum(
-            1 for e in self.events if e["event_type"] != "mouse_move"
-        )
+        total_interactions = len(etype) - event_counts.get("mouse_move", 0)
 
         # Rates (per minute)
         duration_minutes = duration / 60 if duration > 0 else 0
@@ -312,42 +656,30 @@ class InteractionAnalyzer:
         )
 
         # Scroll analysis
-        total_scroll_distance = sum(
-            abs(e.get("dy", 0) or 0)
-            for e in self.events
-            if e["event_type"] == "scroll"
-        )
+        total_scroll_distance = int(np.nansum(np.abs(self.columns["dy"][self._is("scroll")])))
 
         # Pointer movement: total path length and continuous-motion speed.
-        moves = [
-            e for e in self.events
-            if e["event_type"] == "mouse_move" and isinstance(e.get("x"), int)
-        ]
-        mouse_distance = 0.0
-        move_time = 0.0
-        for prev, cur in zip(moves, moves[1:]):
-            mouse_distance += math.hypot(cur["x"] - prev["x"], cur["y"] - prev["y"])
-            dt = cur["timestamp"] - prev["timestamp"]
-            if 0 < dt <= 1.0:  # only count continuous motion, not idle gaps
-                move_time += dt
+        mt, mx, my = self._positioned("mouse_move")
+        mouse_distance = float(np.hypot(np.diff(mx), np.diff(my)).sum())
+        move_dts = np.diff(mt)
+        # only count continuous motion, not idle gaps
+        move_time = float(move_dts[(move_dts > 0) & (move_dts <= 1.0)].sum())
         pointer_speed = mouse_distance / move_time if move_time > 0 else 0
         mouse_distance_per_minute = (
             mouse_distance / duration_minutes if duration_minutes > 0 else 0
         )
 
         # Timing: idle vs active time, median pause, long pauses, time-to-first-action.
-        idle_time = sum(g for g in pauses if g > IDLE_THRESHOLD_S)
+        idle_gaps = gaps[gaps > IDLE_THRESHOLD_S]
+        idle_time = float(idle_gaps.sum()) if idle_gaps.size else 0
         active_time = max(0.0, duration - idle_time)
-        median_pause = statistics.median(pauses) if pauses else 0
-        long_pauses = sum(1 for g in pauses if g > LONG_PAUSE_THRESHOLD_S)
-        first_interaction = next(
-            (e["timestamp"] for e in self.events if e["event_type"] != "mouse_move"),
-            None,
-        )
-        ttfi = first_interaction - min_time if first_interaction is not None else 0
+        median_pause = float(np.median(gaps)) if gaps.size else 0
+        long_pauses = int(np.count_nonzero(gaps > LONG_PAUSE_THRESHOLD_S))
+        interactions = np.flatnonzero(~is_move)
+        ttfi = float(ts[interactions[0]]) - min_time if interactions.size else 0
 
         # Click quality, pointer-path efficiency, and keyboard dynamics.
-        double_clicks = self._count_double_clicks(clicks)
+        double_clicks = self._count_double_clicks()
         path_efficiency = self._movement_efficiency()
         kbd = self._keyboard_metrics(duration_minutes)
 
@@ -362,7 +694,7 @@ class InteractionAnalyzer:
         self.stats = {
             "session_duration_seconds": duration,
             "session_duration_formatted": str(timedelta(seconds=int(duration))),
-            "total_events": len(self.events),
+            "total_events": len(etype),
             "total_interactions": total_interactions,
             "total_mouse_moves": event_counts.get("mouse_move", 0),
             "total_clicks": event_counts.get("mouse_down", 0),
@@ -412,23 +744,20 @@ class InteractionAnalyzer:
 
         return self.stats
 
-    def _count_double_clicks(self, clicks):
+    def _count_double_clicks(self):
         """Count consecutive click pairs that are close in time and space."""
-        count = 0
-        i = 0
-        while i < len(clicks) - 1:
-            a, b = clicks[i], clicks[i + 1]
-            close_in_time = (b["timestamp"] - a["timestamp"]) <= DOUBLE_CLICK_WINDOW_S
-            same_spot = (
-                a["x"] is not None and b["x"] is not None
-                and math.hypot(b["x"] - a["x"], b["y"] - a["y"]) <= DOUBLE_CLICK_DISTANCE_PX
+        c = self.columns
+        is_click = self._is("mouse_down")
+        t, x, y = c["timestamp"][is_click], c["x"][is_click], c["y"][is_click]
+        with np.errstate(invalid="ignore"):  # a missing position is never a pair
+            pair = (np.diff(t) <= DOUBLE_CLICK_WINDOW_S) & (
+                np.hypot(np.diff(x), np.diff(y)) <= DOUBLE_CLICK_DISTANCE_PX
             )
-            if close_in_time and same_spot:
-                count += 1
-                i += 2  # consume both clicks of the pair
-            else:
-                i += 1
-        return count
+        # A pair consumes both of its clicks, scanning left to right, so a run
+        # of k overlapping candidate pairs yields ceil(k / 2) double-clicks.
+        edges = np.diff(np.concatenate(([0], pair.astype(np.int8), [0])))
+        runs = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        return int(((runs + 1) // 2).sum())
 
     def _click_segments(self):
         """Yield qualifying click→click pointer movements.
@@ -443,16 +772,8 @@ class InteractionAnalyzer:
         and the MacKenzie accuracy measures), so they all score the same set of
         movements.
         """
-        clicks = [
-            (e["timestamp"], e["x"], e["y"])
-            for e in self.events
-            if e["event_type"] == "mouse_down" and isinstance(e.get("x"), int)
-        ]
-        moves = [
-            (e["timestamp"], e["x"], e["y"])
-            for e in self.events
-            if e["event_type"] == "mouse_move" and isinstance(e.get("x"), int)
-        ]
+        clicks = self._positioned_points("mouse_down")
+        moves = self._positioned_points("mouse_move")
         if len(clicks) < 2 or not moves:
             return
 
@@ -570,15 +891,16 @@ class InteractionAnalyzer:
 
     def _keyboard_metrics(self, duration_minutes):
         """Inter-key timing and (when not in privacy mode) typing/correction rates."""
-        presses = [e for e in self.events if e["event_type"] == "key_press"]
-        intervals = [b["timestamp"] - a["timestamp"] for a, b in zip(presses, presses[1:])]
-        mean_interkey = statistics.mean(intervals) if intervals else 0
+        is_press = self._is("key_press")
+        keys = self.columns["key"][is_press]
+        intervals = np.diff(self.columns["timestamp"][is_press])
+        mean_interkey = float(intervals.mean()) if intervals.size else 0
 
         # Variability of inter-key timing (rhythm / planning pauses). The
         # coefficient of variation (SD / mean) is dimensionless, so it is
         # comparable across people and machines; it needs no key identity and so
         # survives privacy mode. Reported as None when there are too few presses.
-        interkey_sd = statistics.stdev(intervals) if len(intervals) > 1 else None
+        interkey_sd = float(intervals.std(ddof=1)) if intervals.size > 1 else None
         interkey_cv = (
             round(interkey_sd / mean_interkey, 3)
             if interkey_sd is not None and mean_interkey > 0
@@ -593,8 +915,8 @@ class InteractionAnalyzer:
 
         # Key identities are unavailable in privacy mode, so char/correction
         # metrics are reported as None rather than guessed.
-        redacted = any(e.get("key") == "[REDACTED]" for e in presses)
-        if redacted or not presses:
+        redacted = bool((keys == "[REDACTED]").any())
+        if redacted or not keys.size:
             return {
                 **base,
                 "typing_chars_per_minute": None,
@@ -602,16 +924,14 @@ class InteractionAnalyzer:
                 "correction_rate": None,
             }
 
-        backspaces = sum(
-            1 for e in presses if e.get("key") in ("Key.backspace", "Key.delete")
-        )
-        char_keys = sum(1 for e in presses if len(str(e.get("key") or "")) == 1)
+        backspaces = int(np.isin(keys, ("Key.backspace", "Key.delete")).sum())
+        char_keys = int((np.char.str_len(keys) == 1).sum())
         cpm = char_keys / duration_minutes if duration_minutes > 0 else 0
         return {
             **base,
             "typing_chars_per_minute": round(cpm, 2),
             "backspaces": backspaces,
-            "correction_rate": round(backspaces / len(presses), 3),
+            "correction_rate": round(backspaces / keys.size, 3),
         }
 
     def _modality_switches(self):
@@ -623,13 +943,9 @@ class InteractionAnalyzer:
         deliberate task actions. Grounded in the homing operator of the Keystroke
         -Level Model (Card, Moran & Newell, 1980).
         """
-        mouse = {"mouse_down", "scroll", "drag"}
-        seq = [
-            "m" if e["event_type"] in mouse else "k"
-            for e in self.events
-            if e["event_type"] in mouse or e["event_type"] == "key_press"
-        ]
-        return sum(1 for a, b in zip(seq, seq[1:]) if a != b)
+        is_mouse = self._is("mouse_down") | self._is("scroll") | self._is("drag")
+        seq = is_mouse[is_mouse | self._is("key_press")]
+        return int(np.count_nonzero(seq[1:] != seq[:-1]))
 
     def _scroll_reversals(self):
         """Number of times the scroll direction flips (up→down or down→up).
@@ -638,12 +954,8 @@ class InteractionAnalyzer:
         once scrolls one way; hunting for something reverses repeatedly. Computed
         from the sign of scroll ``dy``; zero-delta scrolls are ignored.
         """
-        dys = [
-            e.get("dy", 0) or 0
-            for e in self.events
-            if e["event_type"] == "scroll"
-        ]
-        return _sign_changes(dys)
+        dys = self.columns["dy"][self._is("scroll")]
+        return _sign_changes(dys.tolist())  # a missing (NaN) dy has no sign
 
     def _pre_click_dwell(self):
         """Mean dwell near the target just before clicking, in seconds.
@@ -657,16 +969,8 @@ class InteractionAnalyzer:
 
         Returns None when no click has a preceding sampled approach.
         """
-        moves = [
-            (e["timestamp"], e["x"], e["y"])
-            for e in self.events
-            if e["event_type"] == "mouse_move" and isinstance(e.get("x"), int)
-        ]
-        clicks = [
-            (e["timestamp"], e["x"], e["y"])
-            for e in self.events
-            if e["event_type"] == "mouse_down" and isinstance(e.get("x"), int)
-        ]
+        moves = self._positioned_points("mouse_move")
+        clicks = self._positioned_points("mouse_down")
         if not moves or not clicks:
             return None
 
@@ -702,22 +1006,14 @@ class InteractionAnalyzer:
         pixel measures, so compare them only within one capture environment (see
         ``capture_region.dpi_scale``). Returns None with fewer than two clicks.
         """
-        pts = [
-            (e["x"], e["y"])
-            for e in self.events
-            if e["event_type"] == "mouse_down" and isinstance(e.get("x"), int)
-        ]
-        if len(pts) < 2:
+        _, xs, ys = self._positioned("mouse_down")
+        if len(xs) < 2:
             return None
-        cx = sum(p[0] for p in pts) / len(pts)
-        cy = sum(p[1] for p in pts) / len(pts)
-        spread = math.sqrt(sum((p[0] - cx) ** 2 + (p[1] - cy) ** 2 for p in pts) / len(pts))
-        xs = [p[0] for p in pts]
-        ys = [p[1] for p in pts]
+        spread = math.sqrt(float(((xs - xs.mean()) ** 2 + (ys - ys.mean()) ** 2).mean()))
         return {
             "click_spread_px": round(spread, 1),
-            "click_bbox_width_px": max(xs) - min(xs),
-            "click_bbox_height_px": max(ys) - min(ys),
+            "click_bbox_width_px": int(xs.max() - xs.min()),
+            "click_bbox_height_px": int(ys.max() - ys.min()),
         }
 
     def calculate_intensity(self, bucket_size=5.0):
@@ -730,38 +1026,42 @@ class InteractionAnalyzer:
         Returns:
             List of time buckets with interaction counts.
         """
+        columns = self.intensity_columns(bucket_size)
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def intensity_columns(self, bucket_size=5.0):
+        """Interaction intensity as columns: one list per field, one entry per bucket.
+
+        The same data as :meth:`calculate_intensity` (fields in the same order),
+        without building a dict per bucket. Empty lists when there are no events.
+        """
         if bucket_size <= 0:
             raise ValueError("bucket_size must be greater than 0")
 
-        if not self.events:
-            return []
+        names = ("time_start", "time_end", "total_interactions", "clicks", "scrolls", "keypresses")
+        ts = self.columns.get("timestamp")
+        if ts is None or not len(ts):
+            return {name: [] for name in names}
 
-        timestamps = [e["timestamp"] for e in self.events]
-        min_time, max_time = min(timestamps), max(timestamps)
+        min_time, max_time = float(ts[0]), float(ts[-1])
         n_buckets = int((max_time - min_time) / bucket_size) + 1
 
-        buckets = [
-            {
-                "time_start": round(min_time + i * bucket_size, 2),
-                "time_end": round(min_time + (i + 1) * bucket_size, 2),
-                "total_interactions": 0,
-                "clicks": 0,
-                "scrolls": 0,
-                "keypresses": 0,
-            }
-            for i in range(n_buckets)
-        ]
-        field = {"mouse_down": "clicks", "scroll": "scrolls", "key_press": "keypresses"}
-        for e in self.events:
-            if e["event_type"] == "mouse_move":
-                continue
-            idx = min(int((e["timestamp"] - min_time) / bucket_size), n_buckets - 1)
-            buckets[idx]["total_interactions"] += 1
-            key = field.get(e["event_type"])
-            if key:
-                buckets[idx][key] += 1
-
-        return buckets
+        # Bucket every event at once, then count each series with bincount
+        # (the last bucket also takes events landing exactly on its end).
+        idx = np.minimum(((ts - min_time) / bucket_size).astype(np.intp), n_buckets - 1)
+        counts = {
+            "total_interactions": np.bincount(idx[~self._is("mouse_move")], minlength=n_buckets),
+            "clicks": np.bincount(idx[self._is("mouse_down")], minlength=n_buckets),
+            "scrolls": np.bincount(idx[self._is("scroll")], minlength=n_buckets),
+            "keypresses": np.bincount(idx[self._is("key_press")], minlength=n_buckets),
+        }
+        # Bucket i spans edges[i]..edges[i + 1]; each edge is rounded once.
+        edges = [round(min_time + i * bucket_size, 2) for i in range(n_buckets + 1)]
+        return {
+            "time_start": edges[:-1],
+            "time_end": edges[1:],
+            **{name: c.tolist() for name, c in counts.items()},
+        }
 
     def save_summary(self, output_file=None):
         """Save summary statistics to CSV file."""
@@ -841,23 +1141,22 @@ class InteractionAnalyzer:
         else:
             output_file = Path(output_file)
 
-        buckets = self.calculate_intensity(bucket_size)
+        columns = self.intensity_columns(bucket_size)
 
         with open(output_file, "w", newline="") as f:
-            if buckets:
-                writer = csv.DictWriter(f, fieldnames=buckets[0].keys())
-                writer.writeheader()
-                writer.writerows(buckets)
+            if columns["time_start"]:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(zip(*columns.values()))
 
         lock_down(output_file)
         return output_file
 
     def _sparkline(self, bucket_size=5.0, width=52):
         """Return a one-line Unicode block sparkline of interaction intensity."""
-        buckets = self.calculate_intensity(bucket_size)
-        if not buckets:
+        values = self.intensity_columns(bucket_size)["total_interactions"]
+        if not values:
             return ""
-        values = [b["total_interactions"] for b in buckets]
         if len(values) > width:
             # downsample: average each slice of buckets into one cell
             step = len(values) / width
@@ -1019,13 +1318,13 @@ def batch_analyze(data_dir):
     for session_dir in sorted(data_dir.iterdir()):
         if not session_dir.is_dir():
             continue
-        events_path = session_dir / "events.csv"
+        events_path = session_events_file(session_dir)
         if not events_path.exists():
             continue
         try:
             analyzer = InteractionAnalyzer(events_path)
-            analyzer.load_events()
-            if not analyzer.events:
+            analyzer.load_events(ANALYSIS_FIELDS)
+            if not analyzer.event_count:
                 continue
             analyzer.calculate_statistics()
             s = analyzer.stats
@@ -123,6 +123,16 @@ Examples:
         "--monitor", choices=["primary", "all"], default="primary",
         help="Which display to capture with --screen (default: primary).",
     )
+    p_record.add_argument(
+        "--move-hz", type=_positive_float, default=None, metavar="HZ",
+        help="Record at most HZ mouse-move samples per second (default: every "
+             "move). Keep it at 30 or more so path measures stay comparable.",
+    )
+    p_record.add_argument(
+        "--format", choices=["csv", "parquet"], default="csv", dest="events_format",
+        help="Events file format (default: csv). parquet is smaller and faster to "
+             "analyze, needs pyarrow, and is only readable once recording stops.",
+    )
     p_record.set_defaults(func=_cmd_record)
 
     # heatmap
@@ -269,6 +279,8 @@ Examples:
 
 
 def _cmd_record(args):
+    from rich.markup import escape
+
     from interlog.recorder import InteractionLogger
 
     if args.name is not None:
@@ -278,11 +290,18 @@ def _cmd_record(args):
             _console().print(f"[red]Error:[/red] {e}")
             return 1
 
-    logger = InteractionLogger(
-        output_dir=args.output,
-        privacy_mode=args.privacy,
-        session_name=args.name,
-    )
+    try:
+        logger = InteractionLogger(
+            output_dir=args.output,
+            privacy_mode=args.privacy,
+            session_name=args.name,
+            move_hz=args.move_hz,
+            events_format=args.events_format,
+        )
+    except ImportError as e:
+        # e.g. --format parquet without pyarrow; the message carries the install hint
+        _console().print(f"[red]Error:[/red] {escape(str(e))}")
+        return 1
 
     if args.screen:
         import sys
@@ -493,7 +512,7 @@ def _cmd_analyze(args):
     if args.batch is not None:
         return _cmd_analyze_batch(args)
 
-    from interlog.analyzer import InteractionAnalyzer, base_prefix
+    from interlog.analyzer import ANALYSIS_FIELDS, InteractionAnalyzer, base_prefix
 
     console = _console()
 
@@ -509,10 +528,10 @@ def _cmd_analyze(args):
     analyzer = InteractionAnalyzer(events_path)
 
     with console.status("[cyan]Analyzing session…[/cyan]", spinner="dots"):
-        analyzer.load_events()
+        analyzer.load_events(ANALYSIS_FIELDS)
         analyzer.calculate_statistics()
 
-    if not analyzer.events:
+    if not analyzer.event_count:
         console.print("[yellow]No events found in file.[/yellow]")
         return 1
 
@@ -678,20 +697,27 @@ def _cmd_analyze_batch(args):
 
 def _analyze_text(analyzer, events_path, out_dir, console=None):
     """Reconstruct typed text and run local lexical analysis (default; privacy-gated)."""
-    from interlog.analyzer import base_prefix
+    from interlog.analyzer import base_prefix, event_rows_from_columns
     from interlog.security import lock_down
     from interlog.text_analysis import is_redacted, lexical_stats, reconstruct_text
 
     if console is None:
         console = _console()
 
-    if is_redacted(analyzer.events):
+    # Only key presses matter here; building rows for every mouse_move is slow.
+    cols = analyzer.columns
+    keys = []
+    if cols:
+        is_key = cols["event_type"] == "key_press"
+        keys = event_rows_from_columns({k: v[is_key] for k, v in cols.items()})
+
+    if is_redacted(keys):
         console.print()
         console.print("  [dim]Text analysis skipped — privacy mode session.[/dim]")
         console.print()
         return
 
-    text = reconstruct_text(analyzer.events)
+    text = reconstruct_text(keys)
     if not text.strip():
         console.print()
         return
@@ -715,10 +741,12 @@ def _analyze_text(analyzer, events_path, out_dir, console=None):
 
 
 def _resolve_events_path(arg):
-    """Accept either an events CSV or a session folder (which contains events.csv)."""
+    """Accept either an events file or a session folder (which contains events.csv)."""
+    from interlog.analyzer import session_events_file
+
     path = Path(arg)
     if path.is_dir():
-        return path / "events.csv"
+        return session_events_file(path)
     return path
 
 
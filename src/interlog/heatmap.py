@@ -9,9 +9,18 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from interlog.analyzer import detect_rage_clicks, load_event_rows, read_session_metadata
+from interlog.analyzer import (
+    detect_rage_clicks,
+    event_rows_from_columns,
+    load_event_columns,
+    read_session_metadata,
+    session_events_file,
+)
 from interlog.security import lock_down
 
+# The only event fields the heatmap draws from; the rest are never parsed.
+HEATMAP_FIELDS = ("timestamp", "event_type", "x", "y")
+
 
 def _grab_frame(video_path, out_path, duration, frame_at=0.25):
     """Extract a single frame at `frame_at` fraction into the recording."""
@@ -94,7 +103,7 @@ def build_heatmap(session_path, output=None, sigma=25, frame_at=0.25):
     session_path = Path(session_path)
     if session_path.is_dir():
         session_dir = session_path
-        events_path = session_dir / "events.csv"
+        events_path = session_events_file(session_dir)
     else:
         session_dir = session_path.parent
         events_path = session_path
@@ -105,7 +114,7 @@ def build_heatmap(session_path, output=None, sigma=25, frame_at=0.25):
         output = session_dir / "heatmap.png"
     output = Path(output)
 
-    events = load_event_rows(events_path)
+    events = event_rows_from_columns(load_event_columns(events_path, fields=HEATMAP_FIELDS))
     if not events:
         raise ValueError("No events found in session.")
 
@@ -1,7 +1,8 @@
-"""Interaction recorder: captures mouse and keyboard events to CSV."""
+"""Interaction recorder: captures mouse and keyboard events to CSV (or Parquet)."""
 
 import csv
 import json
+import math
 import platform
 import signal
 import time
@@ -14,12 +15,52 @@ from interlog.branding import print_banner
 from interlog.security import lock_down
 
 # Column order for the events CSV. Defined once so the header and every
-# subsequent flush stay in sync.
+# subsequent flush stay in sync; InteractionLogger._log_event builds its rows in
+# this order.
 EVENT_FIELDS = [
     "timestamp", "event_type", "x", "y", "button",
     "dx", "dy", "key", "start_x", "start_y", "end_x", "end_y",
 ]
 
+# On-disk formats for the events file (``record --format``).
+EVENT_FORMATS = ("csv", "parquet")
+
+# Numeric columns in the Parquet schema; every other field is stored as text,
+# exactly as it would appear in the CSV.
+PARQUET_NUMERIC_FIELDS = ("timestamp", "x", "y", "dx", "dy")
+
+# Most events the capture buffer may hold between flushes. A flush normally
+# drains it every 0.5 s, so this is only reached if writing stalls for minutes
+# (a hung network drive, say); events beyond it are counted and dropped rather
+# than growing memory without bound.
+MAX_BUFFERED_EVENTS = 250_000
+
+# Buffered rows per Parquet row group. Each row group is written and compressed
+# as a unit, so it is kept much larger than one 0.5 s flush.
+PARQUET_ROW_GROUP_ROWS = 50_000
+
+
+def _parquet_table(rows):
+    """Arrow table of event rows (tuples in EVENT_FIELDS order).
+
+    Blank numeric cells become nulls; text fields are stored as the same strings
+    the CSV writer would produce.
+    """
+    import pyarrow as pa
+
+    schema = pa.schema([
+        (name, pa.float64() if name in PARQUET_NUMERIC_FIELDS else pa.string())
+        for name in EVENT_FIELDS
+    ])
+    cols = list(zip(*rows)) if rows else [()] * len(EVENT_FIELDS)
+    arrays = [
+        pa.array([None if v == "" else v for v in col], type=pa.float64())
+        if name in PARQUET_NUMERIC_FIELDS
+        else pa.array([str(v) for v in col], type=pa.string())
+        for name, col in zip(EVENT_FIELDS, cols)
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
 
 def session_provenance():
     """Environment fingerprint recorded with every session.
@@ -38,10 +79,46 @@ def session_provenance():
     }
 
 
+# str() of pynput buttons and special keys, per object. Both sets are small and
+# fixed (three buttons, a few dozen special keys), and an enum's __str__ is not
+# free, so each is formatted once rather than on every click or key press.
+_BUTTON_NAMES: dict[object, str] = {}
+_KEY_NAMES: dict[object, str] = {}
+
+
+def _button_name(button):
+    """Printable representation of a pynput mouse button, e.g. ``Button.left``."""
+    name = _BUTTON_NAMES.get(button)
+    if name is None:
+        name = _BUTTON_NAMES[button] = str(button)
+    return name
+
+
+def _key_name(key):
+    """Printable representation of a pynput key.
+
+    A character key's ``char`` is used as-is; special keys have no ``char`` (or
+    it is None) and fall back to ``str(key)``, e.g. ``Key.shift``.
+    """
+    char = getattr(key, "char", None)
+    if char:
+        return char
+    name = _KEY_NAMES.get(key)
+    if name is None:
+        name = _KEY_NAMES[key] = str(key)
+    return name
+
+
+def _redacted_key(key):
+    """Privacy-mode stand-in for :func:`_key_name`: records that a key was pressed."""
+    return "[REDACTED]"
+
+
 class InteractionLogger:
     """Captures and logs keyboard and mouse interactions."""
 
-    def __init__(self, output_dir="interlog-data", privacy_mode=False, session_name=None):
+    def __init__(self, output_dir="interlog-data", privacy_mode=False, session_name=None,
+                 move_hz=None, events_format="csv"):
         """
         Initialize the interaction logger.
 
@@ -50,8 +127,26 @@ class InteractionLogger:
                 inside it (named after session_name / the start timestamp).
             privacy_mode: If True, only log that keys were pressed, not which keys.
             session_name: Name for this session (auto-generated if None).
+            move_hz: Cap on recorded mouse_move samples per second. A move that
+                arrives sooner than 1/move_hz after the last recorded one is
+                dropped. None records every move the OS reports.
+            events_format: "csv" (default) or "parquet". Parquet needs pyarrow
+                and is written in large row groups, finalized on stop().
         """
+        if events_format not in EVENT_FORMATS:
+            raise ValueError(f"events_format must be one of {EVENT_FORMATS}, got {events_format!r}")
+        if events_format == "parquet":
+            # Fail before capture starts, not at stop() with events in the buffer.
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    'events_format="parquet" requires pyarrow. '
+                    'Install it with: pip install "interlog[arrow]"'
+                ) from None
         self.privacy_mode = privacy_mode
+        self.move_hz = move_hz
+        self.events_format = events_format
         self.session_name = session_name or datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Each session lives in its own subfolder under the data directory, with
@@ -62,22 +157,43 @@ class InteractionLogger:
         # Captured data is sensitive; keep the session folder owner-only.
         lock_down(self.session_dir, is_dir=True)
 
-        # Event storage
+        # Event storage: one tuple per event in EVENT_FIELDS order, so a buffered
+        # event carries no per-event dict and flushes straight to csv.writer.
         self.events = []
         self.total_events = 0
+        self.dropped_events = 0      # events lost to a full buffer (see MAX_BUFFERED_EVENTS)
         self.start_time = None       # wall clock (for metadata display only)
         self._mono_start = None      # monotonic clock (source of truth for timing)
+        # Pre-bound for the listener callbacks, which run once per event. The
+        # buffer list is never rebound (see _flush_events), so _append stays valid.
+        self._now = time.monotonic
+        self._append = self.events.append
+        # Chosen once so the key callbacks don't re-check privacy_mode per event.
+        self._key_to_str = _redacted_key if privacy_mode else _key_name
         self.stop_event = Event()
         self._stopped = False        # guards stop() against running twice
 
         # Output file paths
-        self.events_file = self.session_dir / "events.csv"
+        self.events_file = self.session_dir / f"events.{events_format}"
         self.metadata_file = self.session_dir / "metadata.json"
 
+        # Events CSV handle, opened on the first flush and held until stop() so
+        # each flush is a write + flush rather than an open/close. A Parquet
+        # session holds a ParquetWriter in _events_writer instead, and collects
+        # flushed rows in _row_group until a full row group is ready.
+        self._events_fh = None
+        self._events_writer = None
+        self._row_group = []
+
         # Listeners
         self.mouse_listener = None
         self.keyboard_listener = None
 
+        # Mouse-move throttle (see move_hz): minimum spacing between recorded
+        # moves, and the timestamp of the last one kept.
+        self._move_interval = 1.0 / move_hz if move_hz else 0.0
+        self._last_move_t = -math.inf
+
         # Drag state: a drag is a press, followed by movement, then a release.
         self.drag_start_pos = None
         self.is_dragging = False
@@ -105,6 +221,11 @@ class InteractionLogger:
             "session_dir": str(self.session_dir.absolute()),
             "provenance": session_provenance(),
         }
+        if self.move_hz:
+            # Pointer measures depend on the sampling rate; record the cap.
+            metadata["move_hz"] = self.move_hz
+        if self.events_format != "csv":
+            metadata["events_format"] = self.events_format
         if self.video_file is not None:
             metadata["video_file"] = Path(self.video_file).name
             metadata["video_start_offset"] = round(self.video_start_offset or 0.0, 3)
@@ -128,14 +249,23 @@ class InteractionLogger:
             return 0.0
         return time.monotonic() - self._mono_start
 
-    def _log_event(self, event_type, **kwargs):
-        """Log an interaction event with timestamp."""
-        event = {
-            "timestamp": self._get_timestamp(),
-            "event_type": event_type,
-            **kwargs,
-        }
-        self.events.append(event)
+    def _log_event(self, event_type, x="", y="", button="", dx="", dy="", key="",
+                   start_x="", start_y="", end_x="", end_y=""):
+        """Log an interaction event with timestamp, as a row in EVENT_FIELDS order.
+
+        This is the capture hot path, so the timestamp is inlined rather than
+        taken from _get_timestamp(): listeners only run after start() has set
+        the monotonic origin. Disk I/O never happens here: the start() loop
+        drains the buffer, and a full buffer (see MAX_BUFFERED_EVENTS) drops
+        the event instead of blocking the listener.
+        """
+        if len(self.events) >= MAX_BUFFERED_EVENTS:
+            self.dropped_events += 1
+            return
+        self._append((
+            self._now() - self._mono_start, event_type, x, y, button,
+            dx, dy, key, start_x, start_y, end_x, end_y,
+        ))
         self.total_events += 1
 
     # Mouse event handlers
@@ -144,17 +274,22 @@ class InteractionLogger:
         # Movement while a button is held marks the gesture as a drag.
         if self.drag_start_pos is not None:
             self.is_dragging = True
+        if self._move_interval:
+            now = self._now()
+            if now - self._last_move_t < self._move_interval:
+                return
+            self._last_move_t = now
         self._log_event("mouse_move", x=x, y=y)
 
     def on_click(self, x, y, button, pressed):
         """Handle mouse click events."""
         if pressed:
-            self._log_event("mouse_down", x=x, y=y, button=str(button))
+            self._log_event("mouse_down", x=x, y=y, button=_button_name(button))
             # Begin tracking a potential drag from this point.
             self.drag_start_pos = (x, y)
             self.is_dragging = False
         else:
-            self._log_event("mouse_up", x=x, y=y, button=str(button))
+            self._log_event("mouse_up", x=x, y=y, button=_button_name(button))
 
             # If the pointer moved while held, record the completed drag.
             if self.is_dragging and self.drag_start_pos:
@@ -173,15 +308,6 @@ class InteractionLogger:
         self._log_event("scroll", x=x, y=y, dx=dx, dy=dy)
 
     # Keyboard event handlers
-    def _key_to_str(self, key):
-        """Return a printable representation of a key, honoring privacy mode."""
-        if self.privacy_mode:
-            return "[REDACTED]"
-        try:
-            return key.char if hasattr(key, "char") and key.char is not None else str(key)
-        except AttributeError:
-            return str(key)
-
     def on_press(self, key):
         """Handle key press events."""
         self._log_event("key_press", key=self._key_to_str(key))
@@ -244,11 +370,13 @@ class InteractionLogger:
         self.mouse_listener.start()
         self.keyboard_listener.start()
 
-        # Write CSV header
-        with open(self.events_file, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)
-            writer.writeheader()
-        lock_down(self.events_file)
+        # Write CSV header (a Parquet file carries its schema instead; its
+        # writer opens with the first row group).
+        if self.events_format == "csv":
+            with open(self.events_file, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)
+                writer.writeheader()
+            lock_down(self.events_file)
 
         # Treat SIGTERM (terminal closed, `kill`) like Ctrl+C so the session is
         # finalized cleanly instead of leaving metadata without end_time/totals.
@@ -258,23 +386,28 @@ class InteractionLogger:
             pass  # not the main thread; the finally below still runs stop()
 
         try:
-            with Live("", refresh_per_second=2, console=console, transient=True) as live:
+            # Live redraws the status line from its own refresh thread, so
+            # neither the capture callbacks nor this flush loop touch the terminal.
+            with Live(get_renderable=self._status_line, refresh_per_second=1,
+                      console=console, transient=True):
                 while not self.stop_event.is_set():
                     time.sleep(0.5)
                     # Flush every tick so an unclean exit loses at most ~0.5s of events.
                     if self.events:
                         self._flush_events()
-                    elapsed = self._get_timestamp()
-                    m, s = divmod(int(elapsed), 60)
-                    live.update(
-                        f"  [green]●[/green]  [bold white]{self.total_events:,}[/bold white] events"
-                        f"  [dim]{m}:{s:02d}  ·  Ctrl+C to stop[/dim]"
-                    )
         except KeyboardInterrupt:
             pass
         finally:
             self.stop()
 
+    def _status_line(self):
+        """One-line recording status, read from the shared event counter."""
+        m, s = divmod(int(self._get_timestamp()), 60)
+        return (
+            f"  [green]●[/green]  [bold white]{self.total_events:,}[/bold white] events"
+            f"  [dim]{m}:{s:02d}  ·  Ctrl+C to stop[/dim]"
+        )
+
     def stop(self):
         """Stop capturing and save all events. Safe to call more than once."""
         if self._stopped:
@@ -302,6 +435,7 @@ class InteractionLogger:
 
         # Flush remaining events
         self._flush_events()
+        self._close_events_file()
 
         # Update metadata with end time and totals
         try:
@@ -310,6 +444,8 @@ class InteractionLogger:
             metadata["end_time"] = datetime.now().isoformat()
             metadata["duration_seconds"] = elapsed
             metadata["total_events"] = self.total_events
+            if self.dropped_events:
+                metadata["dropped_events"] = self.dropped_events
             with open(self.metadata_file, "w") as f:
                 json.dump(metadata, f, indent=2)
         except Exception as e:
@@ -325,6 +461,9 @@ class InteractionLogger:
         console.print()
         console.print(f"  [dim]Events  [/dim]  [cyan]{self.total_events:,}[/cyan]")
         console.print(f"  [dim]Duration[/dim]  [cyan]{m}:{s:02d}[/cyan]")
+        if self.dropped_events:
+            console.print(f"  [yellow]![/yellow]  {self.dropped_events:,} events dropped while "
+                          "writing to disk stalled")
         if self.video_file:
             console.print(f"  [dim]Video   [/dim]  [white]{Path(self.video_file).name}[/white]")
 
@@ -340,16 +479,62 @@ class InteractionLogger:
         console.print()
 
     def _flush_events(self):
-        """Append buffered events to the CSV.
+        """Append buffered events to the CSV (or the pending Parquet row group).
 
-        Listener threads append to ``self.events`` concurrently, so swap the
-        buffer out in one rebind; events arriving mid-flush land in the next one.
+        Listener threads append to ``self.events`` concurrently through the
+        pre-bound ``_append``, so the list is drained in place rather than
+        rebound: the slice copy and the ``del`` are each atomic, and events
+        appended between them sit past ``n`` and land in the next flush.
         """
-        if not self.events:
+        n = len(self.events)
+        if not n:
             return
 
-        batch, self.events = self.events, []
+        batch = self.events[:n]
+        del self.events[:n]
+
+        if self.events_format == "parquet":
+            self._row_group.extend(batch)
+            if len(self._row_group) >= PARQUET_ROW_GROUP_ROWS:
+                self._write_row_group()
+            return
 
-        with open(self.events_file, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=EVENT_FIELDS)
-            writer.writerows(batch)
+        if self._events_fh is None:
+            self._events_fh = open(self.events_file, "a", newline="")  # noqa: SIM115 — held open across flushes, closed in stop()
+            self._events_writer = csv.writer(self._events_fh)
+        self._events_writer.writerows(batch)
+        # Hand the rows to the OS every flush, so an unclean exit still loses
+        # at most one flush interval.
+        self._events_fh.flush()
+
+    def _write_row_group(self):
+        """Write the pending rows to the Parquet file as one row group."""
+        if self._events_writer is None:
+            import pyarrow.parquet as pq
+
+            table = _parquet_table(self._row_group)
+            self._events_writer = pq.ParquetWriter(
+                self.events_file, table.schema, compression="snappy"
+            )
+            lock_down(self.events_file)
+        else:
+            table = _parquet_table(self._row_group)
+        if table.num_rows:
+            self._events_writer.write_table(table)
+        self._row_group = []
+
+    def _close_events_file(self):
+        """Close the events file held open by _flush_events, if any.
+
+        For Parquet this also writes the last (partial) row group and the file
+        footer; until then the file is not readable.
+        """
+        if self.events_format == "parquet":
+            self._write_row_group()
+            self._events_writer.close()
+            self._events_writer = None
+            return
+        if self._events_fh is not None:
+            self._events_fh.close()
+            self._events_fh = None
+            self._events_writer = None
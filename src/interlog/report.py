@@ -11,11 +11,11 @@ from pathlib import Path
 from string import Template
 
 from interlog.analyzer import (
+    ANALYSIS_FIELDS,
     LONG_PAUSE_THRESHOLD_S,
     InteractionAnalyzer,
-    detect_rage_clicks,
-    mouse_down_clicks,
     read_session_metadata,
+    session_events_file,
 )
 from interlog.security import lock_down
 
@@ -333,7 +333,7 @@ def build_report(session_path, output=None, bucket_size=5.0):
     session_path = Path(session_path)
     if session_path.is_dir():
         session_dir = session_path
-        events_path = session_dir / "events.csv"
+        events_path = session_events_file(session_dir)
     else:
         session_dir = session_path.parent
         events_path = session_path
@@ -342,8 +342,8 @@ def build_report(session_path, output=None, bucket_size=5.0):
         raise FileNotFoundError(f"Events file not found: {events_path}")
 
     analyzer = InteractionAnalyzer(events_path)
-    analyzer.load_events()
-    if not analyzer.events:
+    analyzer.load_events(ANALYSIS_FIELDS)
+    if not analyzer.event_count:
         raise ValueError("No events found in session.")
     analyzer.calculate_statistics()
     s = analyzer.stats
@@ -356,7 +356,7 @@ def build_report(session_path, output=None, bucket_size=5.0):
     buckets = analyzer.calculate_intensity(bucket_size)
     duration = s["session_duration_seconds"]
 
-    rage_ts = [b["timestamp"] for b in detect_rage_clicks(mouse_down_clicks(analyzer.events))]
+    rage_ts = [b["timestamp"] for b in analyzer.rage_clicks()]
     sparkline_svg = _build_sparkline_svg(buckets, rage_ts, duration)
 
     heatmap_path = session_dir / "heatmap.png"
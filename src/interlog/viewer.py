@@ -11,11 +11,13 @@ import json
 import webbrowser
 from pathlib import Path
 
+import numpy as np
+
 from interlog.analyzer import (
+    ANALYSIS_FIELDS,
     InteractionAnalyzer,
     base_prefix,
-    detect_rage_clicks,
-    mouse_down_clicks,
+    event_rows_from_columns,
     read_session_metadata,
 )
 from interlog.security import lock_down
@@ -25,7 +27,7 @@ _PLACEHOLDER = "__INTERLOG_DATA__"
 
 # Interaction events worth marking on the timeline (mouse moves are excluded -
 # they are high-volume and low-signal).
-_MARKER_TYPES = {"mouse_down", "scroll", "key_press", "drag"}
+_MARKER_TYPES = ("mouse_down", "scroll", "key_press", "drag")
 
 
 def build_viewer(events_file, output=None, bucket_size=2.0, open_browser=True, video_src=None):
@@ -33,29 +35,32 @@ def build_viewer(events_file, output=None, bucket_size=2.0, open_browser=True, v
     events_file = Path(events_file)
 
     analyzer = InteractionAnalyzer(events_file)
-    analyzer.load_events()
+    analyzer.load_events(ANALYSIS_FIELDS)
 
-    if not analyzer.events:
+    if not analyzer.event_count:
         raise ValueError(f"No events found in {events_file}")
 
-    timestamps = [e["timestamp"] for e in analyzer.events]
-    duration = max(timestamps) - min(timestamps)
+    cols = analyzer.columns
+    duration = float(cols["timestamp"][-1] - cols["timestamp"][0])  # time-ordered
 
+    intensity = analyzer.intensity_columns(bucket_size)
     buckets = [
-        {"t0": b["time_start"], "t1": b["time_end"], "total": b["total_interactions"]}
-        for b in analyzer.calculate_intensity(bucket_size)
+        {"t0": t0, "t1": t1, "total": total}
+        for t0, t1, total in zip(
+            intensity["time_start"], intensity["time_end"], intensity["total_interactions"]
+        )
     ]
 
+    is_marker = np.isin(cols["event_type"], _MARKER_TYPES)
     markers = [
         {"t": round(e["timestamp"], 3), "type": e["event_type"],
-         "x": e.get("x"), "y": e.get("y")}
-        for e in analyzer.events
-        if e["event_type"] in _MARKER_TYPES
+         "x": e["x"], "y": e["y"]}
+        for e in event_rows_from_columns({k: v[is_marker] for k, v in cols.items()})
     ]
 
     rage = [
         {"t": round(r["timestamp"], 3), "x": r["x"], "y": r["y"], "count": r["click_count"]}
-        for r in detect_rage_clicks(mouse_down_clicks(analyzer.events))
+        for r in analyzer.rage_clicks()
     ]
 
     session_label = base_prefix(events_file).rstrip("_") or events_file.parent.name
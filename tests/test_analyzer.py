@@ -1,11 +1,21 @@
 """Tests for interlog.analyzer: metrics, rage clicks, summary export, batch."""
 
+import csv
 import json
 import math
+import random
 
+import numpy as np
 import pytest
 
-from interlog.analyzer import InteractionAnalyzer, base_prefix, batch_analyze
+from interlog.analyzer import (
+    InteractionAnalyzer,
+    _rage_click_spans,
+    base_prefix,
+    batch_analyze,
+    event_rows_from_columns,
+    load_event_columns,
+)
 from interlog.demo import generate
 
 
@@ -21,6 +31,113 @@ def test_base_prefix(name, expected):
     assert base_prefix(name) == expected
 
 
+# --- loading ---------------------------------------------------------------
+
+def test_load_event_columns_parses_numbers_per_column(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [
+        {"timestamp": 0.5, "event_type": "mouse_down", "x": 10.7, "y": 20, "button": "Button.left"},
+        {"timestamp": 1.25, "event_type": "key_press", "key": "a"},
+        {"timestamp": 2.0, "event_type": "scroll", "x": "oops", "y": 5, "dy": -3},
+    ])
+    cols = load_event_columns(events)
+
+    assert cols["timestamp"].tolist() == [0.5, 1.25, 2.0]
+    assert cols["event_type"].tolist() == ["mouse_down", "key_press", "scroll"]
+    assert cols["x"][0] == 10                   # truncated to whole pixels
+    assert math.isnan(cols["x"][1])             # blank cell -> missing
+    assert math.isnan(cols["x"][2])             # non-numeric cell -> missing, not an error
+    assert cols["dy"][2] == -3
+
+    rows = event_rows_from_columns(cols)
+    assert rows[0]["x"] == 10 and isinstance(rows[0]["x"], int)
+    assert rows[1]["x"] is None
+    assert rows[1]["key"] == "a"
+
+
+def test_load_event_columns_projects_fields(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [
+        {"timestamp": 0.5, "event_type": "mouse_down", "x": 10, "y": 20, "button": "Button.left"},
+        {"timestamp": 1.0, "event_type": "key_press", "key": "a"},
+    ])
+    cols = load_event_columns(events, fields=("timestamp", "x", "not_in_file"))
+    assert list(cols) == ["timestamp", "x", "not_in_file"]
+    assert cols["timestamp"].tolist() == [0.5, 1.0]
+    assert cols["not_in_file"].tolist() == ["", ""]  # still present, one cell per row
+
+
+def test_load_event_columns_duplicate_header_keeps_positions(tmp_path):
+    events = tmp_path / "events.csv"
+    events.write_text("timestamp,event_type,x,x,y\n1.0,mouse_down,1,2,3\n")
+    cols = load_event_columns(events)
+    assert cols["x"][0] == 2  # last duplicate wins, as with DictReader
+    assert cols["y"][0] == 3
+    assert cols["event_type"].tolist() == ["mouse_down"]
+
+
+def test_load_event_columns_header_only(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [])
+    cols = load_event_columns(events)
+    assert len(cols["timestamp"]) == 0
+    a = InteractionAnalyzer(events)
+    a.load_events()
+    assert a.events == []
+    assert a.calculate_statistics() == {}
+
+
+def test_load_events_restores_time_order(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [
+        {"timestamp": 1.0, "event_type": "mouse_down", "x": 1, "y": 1},
+        {"timestamp": 3.0, "event_type": "key_press", "key": "b"},
+        {"timestamp": 2.0, "event_type": "key_press", "key": "a"},  # listener interleave
+        {"timestamp": 3.0, "event_type": "key_release", "key": "b"},
+    ])
+    a = InteractionAnalyzer(events)
+    a.load_events()
+    assert a.columns["timestamp"].tolist() == [1.0, 2.0, 3.0, 3.0]
+    assert a.columns["event_type"].tolist() == ["mouse_down", "key_press", "key_press", "key_release"]
+    assert a.columns["key"].tolist() == ["", "a", "b", "b"]  # equal times keep file order
+    assert a.calculate_statistics()["session_duration_seconds"] == 2.0
+
+
+def test_csv_reader_chunks_join_seamlessly(tmp_path, monkeypatch):
+    from interlog import analyzer
+    from interlog.analyzer import _read_columns_csv
+
+    events = generate(tmp_path, seed=3)[0] / "events.csv"
+    whole, n = _read_columns_csv(events)
+    monkeypatch.setattr(analyzer, "CSV_CHUNK_ROWS", 7)
+    chunked, n_chunked = _read_columns_csv(events)
+    assert n_chunked == n
+    assert list(chunked) == list(whole)
+    for name, col in whole.items():
+        if col.dtype.kind == "f":
+            np.testing.assert_array_equal(chunked[name], col)
+        else:
+            assert chunked[name].tolist() == col.tolist()
+
+
+def test_arrow_reader_matches_csv_reader(tmp_path):
+    pytest.importorskip("pyarrow")
+    from interlog.analyzer import _read_columns_arrow, _read_columns_csv
+
+    events = generate(tmp_path, seed=3)[0] / "events.csv"
+    parsed = _read_columns_arrow(events)
+    assert parsed is not None
+    via_arrow, n = parsed
+    via_csv, n_csv = _read_columns_csv(events)
+    assert n == n_csv
+    assert list(via_arrow) == list(via_csv)
+    for name, col in via_csv.items():
+        if col.dtype.kind == "f":
+            np.testing.assert_array_equal(via_arrow[name], col)
+        else:
+            assert via_arrow[name].tolist() == col.tolist()
+
+
 # --- statistics & rage clicks ----------------------------------------------
 
 def test_statistics_and_rage_clicks(tmp_path, write_events):
@@ -75,6 +192,58 @@ def test_rage_clicks_chain_across_drift(tmp_path, write_events):
     assert s["rage_clicks_detected"] == 1
 
 
+def _reference_rage_spans(clicks, time_window=1.0, distance_threshold=50):
+    """The scalar rage-click scan _rage_click_spans vectorizes, as (start, end) spans."""
+    spans = []
+    i, n = 0, len(clicks)
+    while i < n - 1:
+        j = i + 1
+        while j < n and clicks[j][0] - clicks[i][0] <= time_window:
+            j += 1
+        window = clicks[i:j]
+        same_area = all(
+            a[1] is not None and b[1] is not None
+            and math.hypot(b[1] - a[1], b[2] - a[2]) <= distance_threshold
+            for a, b in zip(window, window[1:])
+        )
+        if len(window) >= 3 and same_area:
+            spans.append((i, j))
+            i = j
+        else:
+            i += 1
+    return spans
+
+
+def _spans(clicks):
+    ts = np.array([c[0] for c in clicks], dtype=float)
+    xs = np.array([math.nan if c[1] is None else c[1] for c in clicks], dtype=float)
+    ys = np.array([c[2] for c in clicks], dtype=float)
+    return _rage_click_spans(ts, xs, ys)
+
+
+def test_rage_click_spans_window_edges_and_missing_x():
+    # 4.9 - 3.9 is a hair over 1.0 in floating point, but 3.9 + 1.0 == 4.9, so a
+    # plain searchsorted window would wrongly take the 4.9 click.
+    over = [(3.9, 10, 10), (4.4, 10, 10), (4.9, 10, 10)]
+    assert _reference_rage_spans(over) == [] == _spans(over)
+    # The reverse: 1.594 - 0.594 == 1.0 lands exactly on ts[i] + time_window, yet
+    # 0.594 + 1.0 rounds below 1.594.
+    exact = [(0.594, 10, 10), (1.0, 10, 10), (1.594, 10, 10)]
+    assert _reference_rage_spans(exact) == [(0, 3)] == _spans(exact)
+    missing = [(0.0, 10, 10), (0.1, None, 10), (0.2, 10, 10), (0.3, 10, 10)]
+    assert _reference_rage_spans(missing) == _spans(missing)
+
+
+def test_rage_click_spans_match_scalar_scan_on_random_streams():
+    rng = random.Random(11)
+    for _ in range(2000):
+        t, clicks = 0.0, []
+        for _ in range(rng.randint(0, 25)):
+            t = round(t + rng.choice([0.0, 0.05, 0.1, 0.3, 0.5, 1.0, 2.0]) * rng.random() * 2, 3)
+            clicks.append((t, rng.choice([None, 100, 101, 120, 160]), rng.choice([100, 130])))
+        assert _spans(clicks) == _reference_rage_spans(clicks), clicks
+
+
 # --- pointer-path efficiency -----------------------------------------------
 
 def test_path_efficiency_direct_move_is_one(tmp_path, write_events):
@@ -175,6 +344,22 @@ def test_pointer_and_timing_metrics(tmp_path, write_events):
     assert s["time_to_first_interaction_seconds"] == pytest.approx(0.5, abs=0.01)
     assert s["long_pauses"] == 1
     assert s["idle_time_seconds"] == pytest.approx(4.5, abs=0.1)
+    assert s["longest_pause_seconds"] == pytest.approx(4.5, abs=0.01)
+    assert s["average_pause_seconds"] == pytest.approx(1.25, abs=0.001)  # 5.0s over 4 gaps
+    assert s["median_pause_seconds"] == pytest.approx(0.2, abs=0.001)
+
+
+def test_idle_time_stays_int_zero_without_idle_gaps(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [
+        {"timestamp": 0.0, "event_type": "key_press", "key": "a"},
+        {"timestamp": 0.5, "event_type": "key_press", "key": "b"},
+    ])
+    a = InteractionAnalyzer(events)
+    a.load_events()
+    s = a.calculate_statistics()
+    # summary.csv / summary.json write "0", as before the numpy rewrite
+    assert s["idle_time_seconds"] == 0 and isinstance(s["idle_time_seconds"], int)
 
 
 def test_click_quality_and_keyboard_metrics(tmp_path, write_events):
@@ -397,7 +582,10 @@ def test_scroll_reversals_counts_direction_flips(tmp_path, write_events):
     ])
     a = InteractionAnalyzer(events)
     a.load_events()
-    assert a.calculate_statistics()["scroll_reversals"] == 2
+    s = a.calculate_statistics()
+    assert s["scroll_reversals"] == 2
+    assert s["total_scroll_distance"] == 4
+    assert s["total_scrolls"] == 4
 
 
 def test_pre_click_dwell_measures_settling_time(tmp_path, write_events):
@@ -467,6 +655,35 @@ def test_accuracy_counts_are_sampling_rate_invariant(tmp_path, write_events):
     assert odc_for(6) == odc_for(40)
 
 
+def test_calculate_intensity_buckets_by_type(tmp_path, write_events):
+    events = tmp_path / "events.csv"
+    write_events(events, [
+        {"timestamp": 0.0, "event_type": "mouse_down", "x": 1, "y": 1},
+        {"timestamp": 1.0, "event_type": "mouse_move", "x": 2, "y": 2},   # not an interaction
+        {"timestamp": 4.9, "event_type": "key_press", "key": "a"},
+        {"timestamp": 5.0, "event_type": "scroll", "x": 2, "y": 2, "dy": 1},
+        {"timestamp": 10.0, "event_type": "mouse_down", "x": 1, "y": 1},  # on the last edge
+    ])
+    a = InteractionAnalyzer(events)
+    a.load_events()
+    buckets = a.calculate_intensity(5.0)
+
+    assert [(b["time_start"], b["time_end"]) for b in buckets] == [(0.0, 5.0), (5.0, 10.0), (10.0, 15.0)]
+    assert [b["total_interactions"] for b in buckets] == [2, 1, 1]
+    assert [b["clicks"] for b in buckets] == [1, 0, 1]
+    assert [b["keypresses"] for b in buckets] == [1, 0, 0]
+    assert [b["scrolls"] for b in buckets] == [0, 1, 0]
+
+    cols = a.intensity_columns(5.0)
+    assert cols["time_start"] == [0.0, 5.0, 10.0]
+    assert cols["total_interactions"] == [2, 1, 1]
+    out = a.save_intensity(tmp_path / "intensity.csv", 5.0)
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[1] == {"time_start": "5.0", "time_end": "10.0", "total_interactions": "1",
+                       "clicks": "0", "scrolls": "1", "keypresses": "0"}
+
+
 def test_calculate_intensity_rejects_nonpositive_bucket(tmp_path, write_events):
     events = tmp_path / "events.csv"
     write_events(events, [{"timestamp": 0.0, "event_type": "mouse_down", "x": 1, "y": 1}])
@@ -17,6 +17,11 @@ def test_resolve_events_path_folder(tmp_path):
     assert _resolve_events_path(str(tmp_path)) == tmp_path / "events.csv"
 
 
+def test_resolve_events_path_folder_with_parquet(tmp_path):
+    (tmp_path / "events.parquet").write_bytes(b"")
+    assert _resolve_events_path(str(tmp_path)) == tmp_path / "events.parquet"
+
+
 def test_resolve_events_path_file(tmp_path):
     f = tmp_path / "p01_events.csv"
     f.write_text("x")
@@ -66,6 +71,14 @@ def test_record_rejects_monitor_all_off_windows(monkeypatch, tmp_path):
     assert rc == 1
 
 
+def test_record_parquet_without_pyarrow_prints_install_hint(monkeypatch, tmp_path, capsys):
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    rc = main(["record", "--format", "parquet", "-o", str(tmp_path)])
+    assert rc == 1
+    assert '"interlog[arrow]"' in capsys.readouterr().out
+    assert list(tmp_path.iterdir()) == []
+
+
 # --- session name validation (path traversal) ------------------------------
 
 @pytest.mark.parametrize("bad", ["../../evil", "..", "a/b", "a\\b", "sub/../x"])
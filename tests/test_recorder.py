@@ -1,7 +1,10 @@
 """Tests for interlog.recorder: session layout, timing, drags, metadata."""
 
 import csv
+import math
+import sys
 import time
+from types import SimpleNamespace
 
 import pytest
 
@@ -9,6 +12,11 @@ from interlog.recorder import EVENT_FIELDS, InteractionLogger
 from interlog.sync import event_offset
 
 
+def _buffered(log):
+    """The logger's not-yet-flushed events, as dicts keyed by EVENT_FIELDS."""
+    return [dict(zip(EVENT_FIELDS, row)) for row in log.events]
+
+
 def test_session_dir_and_filenames(tmp_path):
     log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
     assert log.session_dir == tmp_path / "s1"
@@ -24,6 +32,14 @@ def test_timestamp_is_monotonic(tmp_path):
     assert log._get_timestamp() == pytest.approx(5.0, abs=0.5)
 
 
+def test_status_line_reads_counter_and_clock(tmp_path):
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
+    log._mono_start = time.monotonic() - 75.0
+    log.total_events = 1234
+    line = log._status_line()
+    assert "1,234" in line and "1:15" in line
+
+
 def test_drag_detection(tmp_path):
     log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
     log._mono_start = time.monotonic()
@@ -36,10 +52,60 @@ def test_drag_detection(tmp_path):
     log.on_click(200, 200, "Button.left", True)
     log.on_click(200, 200, "Button.left", False)
 
-    types = [e["event_type"] for e in log.events]
+    types = [e["event_type"] for e in _buffered(log)]
     assert types.count("drag") == 1
 
 
+def test_key_strings_and_privacy_redaction(tmp_path):
+    class SpecialKey:  # pynput special keys have no usable .char
+        char = None
+
+        def __str__(self):
+            return "Key.shift"
+
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
+    log._mono_start = time.monotonic()
+    log.on_press(SimpleNamespace(char="a"))
+    log.on_release(SpecialKey())
+    log.on_press("Key.esc")  # no .char attribute at all
+    assert [e["key"] for e in _buffered(log)] == ["a", "Key.shift", "Key.esc"]
+
+    calls = []
+
+    class CountingKey(SpecialKey):
+        def __str__(self):
+            calls.append(1)
+            return "Key.ctrl"
+
+    ctrl = CountingKey()
+    log.on_press(ctrl)
+    log.on_release(ctrl)
+    assert _buffered(log)[-1]["key"] == "Key.ctrl"
+    assert len(calls) == 1  # special-key names are formatted once, then cached
+
+    private = InteractionLogger(output_dir=str(tmp_path), session_name="s2", privacy_mode=True)
+    private._mono_start = time.monotonic()
+    private.on_press(SimpleNamespace(char="a"))
+    assert _buffered(private)[0]["key"] == "[REDACTED]"
+
+
+def test_move_hz_throttles_mouse_moves(tmp_path):
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1", move_hz=10)
+    log._mono_start = time.monotonic()
+
+    log.on_click(10, 10, "Button.left", True)
+    for i in range(5):                 # a burst well inside one 0.1s interval
+        log.on_move(10 + i, 10)
+    log._last_move_t -= 1.0            # pretend the interval has elapsed
+    log.on_move(60, 60)
+    log.on_click(60, 60, "Button.left", False)
+
+    types = [e["event_type"] for e in _buffered(log)]
+    assert types.count("mouse_move") == 2
+    assert types.count("drag") == 1    # dropped moves still mark the drag
+    assert log._build_metadata()["move_hz"] == 10
+
+
 def test_flush_writes_rows(tmp_path):
     log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
     log._mono_start = time.monotonic()
@@ -55,6 +121,90 @@ def test_flush_writes_rows(tmp_path):
     assert not log.events  # buffer cleared after flush
 
 
+def test_flush_drains_buffer_in_place(tmp_path):
+    # Listeners append through a pre-bound method, so a flush must empty the
+    # same list rather than swap in a new one that they would never see.
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
+    log._mono_start = time.monotonic()
+    buffer = log.events
+    log._log_event("key_press", key="a")
+    log._flush_events()
+    log._log_event("key_press", key="b")
+
+    assert log.events is buffer
+    assert [e["key"] for e in _buffered(log)] == ["b"]
+    log._close_events_file()
+
+
+def test_full_buffer_drops_and_counts_events(tmp_path, monkeypatch):
+    monkeypatch.setattr("interlog.recorder.MAX_BUFFERED_EVENTS", 2)
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
+    log._mono_start = time.monotonic()
+    for k in "abc":
+        log._log_event("key_press", key=k)
+    assert [e["key"] for e in _buffered(log)] == ["a", "b"]
+    assert (log.total_events, log.dropped_events) == (2, 1)
+
+    log._flush_events()  # draining the buffer makes room again
+    log._log_event("key_press", key="d")
+    assert log.total_events == 3
+    log._close_events_file()
+
+
+def test_flush_reuses_one_file_handle(tmp_path):
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1")
+    log._mono_start = time.monotonic()
+    with open(log.events_file, "w", newline="") as f:
+        csv.DictWriter(f, fieldnames=EVENT_FIELDS).writeheader()
+
+    log._log_event("key_press", key="a")
+    log._flush_events()
+    handle = log._events_fh
+    log._log_event("key_press", key="b")
+    log._flush_events()
+    assert log._events_fh is handle  # held open across flushes
+
+    # Rows are visible on disk before the handle is closed.
+    with open(log.events_file) as f:
+        assert [r["key"] for r in csv.DictReader(f)] == ["a", "b"]
+
+    log._close_events_file()
+    assert handle.closed
+    assert log._events_fh is None
+
+
+def test_parquet_format_round_trips_through_analyzer(tmp_path):
+    pytest.importorskip("pyarrow")
+    from interlog.analyzer import load_event_columns
+
+    log = InteractionLogger(output_dir=str(tmp_path), session_name="s1", events_format="parquet")
+    assert log.events_file.name == "events.parquet"
+    log._mono_start = time.monotonic()
+    log._log_event("mouse_down", x=10, y=20, button="Button.left")
+    log._log_event("key_press", key="a")
+    log._flush_events()
+    log._log_event("drag", start_x=1, start_y=2, end_x=30, end_y=40)
+    log._flush_events()
+    log._close_events_file()
+
+    cols = load_event_columns(log.events_file)
+    assert cols["event_type"].tolist() == ["mouse_down", "key_press", "drag"]
+    assert cols["x"][0] == 10 and math.isnan(cols["x"][1])
+    assert cols["key"].tolist() == ["", "a", ""]
+    assert cols["end_x"][2] == "30"
+
+
+def test_unknown_events_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        InteractionLogger(output_dir=str(tmp_path), session_name="s1", events_format="xlsx")
+
+
+def test_parquet_format_requires_pyarrow_up_front(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)  # import fails
+    with pytest.raises(ImportError, match="pyarrow"):
+        InteractionLogger(output_dir=str(tmp_path), session_name="s1", events_format="parquet")
+
+
 # --- session metadata ------------------------------------------------------
 
 def test_metadata_includes_provenance(tmp_path):